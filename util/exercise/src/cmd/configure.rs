@@ -2,8 +2,9 @@ use crate::{self as exercise, errors::Result, get, get_mut, val_as};
 use failure::format_err;
 use serde_json::{self, json, Value};
 use std::{
-    fs,
-    io::{stdin, stdout, Write},
+    collections::HashSet,
+    fs::{self, File},
+    io::{stdin, stdout, BufWriter, Write},
     path::Path,
 };
 use uuid::Uuid;
@@ -30,6 +31,14 @@ fn get_user_config(exercise_name: &str, config_content: &Value) -> Result<Value>
         Uuid::new_v4().to_hyphenated().to_string()
     };
 
+    // Slug lookups happen on every pass through the prompt loop below;
+    // collect them into a set once instead of rescanning the whole
+    // exercises array per attempt.
+    let existing_slugs: HashSet<&str> = get!(config_content, "exercises", as_array)
+        .iter()
+        .filter_map(|exercise| exercise["slug"].as_str())
+        .collect();
+
     let unlocked_by: Option<String> = loop {
         let default_value = if let Some(existing_config) = existing_config {
             if let Value::String(s) = get!(existing_config, "unlocked_by") {
@@ -50,10 +59,7 @@ fn get_user_config(exercise_name: &str, config_content: &Value) -> Result<Value>
             break Some(default_value.to_string());
         } else if user_input == "null" {
             break None;
-        } else if !get!(config_content, "exercises", as_array)
-            .iter()
-            .any(|exercise| exercise["slug"] == user_input)
-        {
+        } else if !existing_slugs.contains(user_input.as_str()) {
             println!("{} is not an existing exercise slug", user_input);
             continue;
         } else {
@@ -63,26 +69,28 @@ fn get_user_config(exercise_name: &str, config_content: &Value) -> Result<Value>
 
     let core = unlocked_by.is_none();
 
-    let difficulty = loop {
-        let unlocked_by_difficulty = match unlocked_by {
-            Some(ref unlocked_by) => {
-                let unlocked_by_exercise = get!(config_content, "exercises", as_array)
-                    .iter()
-                    .find(|exercise| exercise["slug"] == unlocked_by.as_str())
-                    .ok_or_else(|| format_err!("exercise '{}' not found in config", unlocked_by))?;
-
-                get!(unlocked_by_exercise, "difficulty", as_u64)
-            }
+    // None of these change while the user is answering the difficulty
+    // prompt, so resolve them once instead of on every retry.
+    let unlocked_by_difficulty = match unlocked_by {
+        Some(ref unlocked_by) => {
+            let unlocked_by_exercise = get!(config_content, "exercises", as_array)
+                .iter()
+                .find(|exercise| exercise["slug"] == unlocked_by.as_str())
+                .ok_or_else(|| format_err!("exercise '{}' not found in config", unlocked_by))?;
 
-            None => 1,
-        };
+            get!(unlocked_by_exercise, "difficulty", as_u64)
+        }
 
-        let available_difficulties: Vec<u64> = [1, 4, 7, 10]
-            .iter()
-            .skip_while(|&&difficulty| difficulty < unlocked_by_difficulty)
-            .cloned()
-            .collect();
+        None => 1,
+    };
+
+    let available_difficulties: Vec<u64> = [1, 4, 7, 10]
+        .iter()
+        .skip_while(|&&difficulty| difficulty < unlocked_by_difficulty)
+        .cloned()
+        .collect();
 
+    let difficulty = loop {
         let default_value = if let Some(existing_config) = existing_config {
             get!(existing_config, "difficulty", as_u64)
         } else {
@@ -180,16 +188,28 @@ fn choose_exercise_insert_index(
     exercises: &[Value],
     difficulty: &Value,
 ) -> Result<usize> {
-    loop {
-        let mut exercises_with_similar_difficulty = Vec::with_capacity(exercises.len());
-        for (index, exercise) in exercises
+    // The difficulty bucket only depends on the config contents, so build it
+    // once instead of rescanning every exercise each time the user rejects a
+    // proposed position.
+    let mut exercises_with_similar_difficulty = Vec::with_capacity(exercises.len());
+    for (index, exercise) in exercises
+        .iter()
+        .enumerate()
+        .filter(|(_, exercise)| exercise["difficulty"] == *difficulty)
+    {
+        exercises_with_similar_difficulty.push((index, get!(exercise, "slug", as_str)));
+    }
+
+    // With no exercise of the same difficulty there is nothing to bisect
+    // against; place the new exercise before the first harder one.
+    if exercises_with_similar_difficulty.is_empty() {
+        return Ok(exercises
             .iter()
-            .enumerate()
-            .filter(|(_, exercise)| exercise["difficulty"] == *difficulty)
-        {
-            exercises_with_similar_difficulty.push((index, get!(exercise, "slug", as_str)));
-        }
+            .position(|exercise| exercise["difficulty"].as_u64() > difficulty.as_u64())
+            .unwrap_or_else(|| exercises.len()));
+    }
 
+    loop {
         let mut start_index = 0;
 
         let mut end_index = exercises_with_similar_difficulty.len() - 1;
@@ -294,9 +314,10 @@ pub fn configure_exercise(exercise_name: &str) -> Result<()> {
 
     let config_path = Path::new(&*exercise::TRACK_ROOT).join("config.json");
 
-    let config_content_string = fs::read_to_string(&config_path)?;
-
-    let mut config_content: Value = serde_json::from_str(&config_content_string)?;
+    // serde_json validates UTF-8 while parsing, so deserialize straight from
+    // the raw bytes rather than paying for a separate validation pass in
+    // read_to_string.
+    let mut config_content: Value = serde_json::from_slice(&fs::read(&config_path)?)?;
 
     let config_exists = get!(config_content, "exercises", as_array)
         .iter()
@@ -322,7 +343,17 @@ pub fn configure_exercise(exercise_name: &str) -> Result<()> {
         insert_user_config(exercise_name, &mut config_content, user_config)?;
     }
 
-    fs::write(&config_path, serde_json::to_string_pretty(&config_content)?)?;
+    // Stream the pretty-printed config into a temp file and rename it into
+    // place. Flushing explicitly surfaces write errors that a dropped
+    // BufWriter would swallow, and the rename ensures a failed write can
+    // never leave a truncated config.json behind.
+    let tmp_path = config_path.with_extension("json.tmp");
+
+    let mut writer = BufWriter::new(File::create(&tmp_path)?);
+    serde_json::to_writer_pretty(&mut writer, &config_content)?;
+    writer.flush()?;
+
+    fs::rename(&tmp_path, &config_path)?;
 
     println!("Formatting the config.json file via 'bin/configlet fmt'");
 
@@ -27,7 +27,9 @@ fn get_os_arch() -> String {
 
 // Makes a request to the Github API to get and return the download url for the latest configlet release
 fn get_download_url() -> Result<String> {
-    reqwest::get("https://api.github.com/repos/exercism/configlet/releases/latest")?
+    crate::HTTP_CLIENT
+        .get("https://api.github.com/repos/exercism/configlet/releases/latest")
+        .send()?
         .json::<Value>()?
         .get("assets")
         .and_then(Value::as_array)
@@ -44,7 +46,7 @@ fn get_download_url() -> Result<String> {
 //
 // returns the path into which the bin was extracted on success
 pub fn download() -> Result<PathBuf> {
-    let response = reqwest::get(&get_download_url()?)?;
+    let response = crate::HTTP_CLIENT.get(&get_download_url()?).send()?;
     let mut archive = Archive::new(GzDecoder::new(response));
     let download_path = Path::new(&*crate::TRACK_ROOT).join("bin");
     archive
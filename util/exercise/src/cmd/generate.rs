@@ -2,10 +2,11 @@
 use crate::{self as exercise, errors::Result, structs::CanonicalData, TEMPLATES};
 use failure::format_err;
 use std::{
-    fs::{self, File, OpenOptions},
+    fs::{self, OpenOptions},
     io::Write,
     path::Path,
     process::{Command, Stdio},
+    thread,
 };
 use tera::Context;
 
@@ -17,15 +18,30 @@ const METADATA_YML_CONTENT: &str = include_str!("defaults/metadata.yml");
 // Generate .meta directory and its contents without using the canonical data
 fn generate_meta(exercise_name: &str, exercise_path: &Path) -> Result<()> {
     let meta_dir = exercise_path.join(".meta");
-    fs::create_dir(&meta_dir)?;
-
-    for (file, content) in [
-        ("description.md", DESCRIPTION_MD_CONTENT),
-        ("metadata.yml", METADATA_YML_CONTENT),
+    // create_dir_all tolerates the directory already existing, so reruns and
+    // concurrent invocations don't race on the existence check.
+    fs::create_dir_all(&meta_dir)?;
+
+    // The two canonical-file checks are independent network round trips;
+    // run one on a helper thread so they overlap instead of queueing.
+    let description_check = {
+        let exercise_name = exercise_name.to_string();
+        thread::spawn(move || exercise::canonical_file_exists(&exercise_name, "description.md"))
+    };
+
+    let metadata_exists = exercise::canonical_file_exists(exercise_name, "metadata.yml")?;
+
+    let description_exists = description_check
+        .join()
+        .expect("description.md existence check panicked")?;
+
+    for (file, content, exists) in [
+        ("description.md", DESCRIPTION_MD_CONTENT, description_exists),
+        ("metadata.yml", METADATA_YML_CONTENT, metadata_exists),
     ]
     .iter()
     {
-        if !exercise::canonical_file_exists(exercise_name, file)? {
+        if !exists {
             fs::write(exercise_path.join(".meta").join(file), content)?;
         }
     }
@@ -138,7 +154,7 @@ pub fn generate_exercise(exercise_name: &str, use_maplit: bool) -> Result<()> {
         cargo_toml_file.write_all(b"maplit = \"1.0.1\"")?;
     }
 
-    fs::create_dir(exercise_path.join("tests"))?;
+    fs::create_dir_all(exercise_path.join("tests"))?;
 
     let test_file_name = exercise_path
         .join("tests")
@@ -163,30 +179,14 @@ pub fn generate_exercise(exercise_name: &str, use_maplit: bool) -> Result<()> {
                 &exercise_name
             );
 
-            let mut test_file = File::create(test_file_name)?;
-
-            test_file.write_all(
-                &format!(
-                    "//! Tests for {exercise_name} \n\
-                     //! \n\
-                     //! Generated by [utility][utility]\n\
-                     //! \n\
-                     //! [utility]: https://github.com/exercism/rust/tree/main/util/exercise\n\
-                     \n",
-                    exercise_name = exercise_name,
-                )
-                .into_bytes(),
-            )?;
-            if use_maplit {
-                test_file.write_all(b"use maplit::hashmap;\n")?;
-            }
-
-            test_file.write_all(
-                &format!(
-                    "use {escaped_exercise_name}::*;\n\n\n",
-                    escaped_exercise_name = exercise_name.replace("-", "_"),
-                )
-                .into_bytes(),
+            let mut context = Context::new();
+            context.insert("exercise", &exercise_name);
+            context.insert("exercise_mod", &exercise_name.replace("-", "_"));
+            context.insert("use_maplit", &use_maplit);
+
+            fs::write(
+                test_file_name,
+                TEMPLATES.render("test_file_stub.rs", &context)?,
             )?;
         }
     }
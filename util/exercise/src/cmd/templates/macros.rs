@@ -27,6 +27,8 @@
         ]
     {% elif value is string -%}
         "{{ value }}"
+    {% elif value == true or value == false -%}
+        {{ value }}
     {% elif value is number -%}
         {{ value }}
     {% else -%}
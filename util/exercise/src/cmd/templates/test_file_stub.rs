@@ -0,0 +1,8 @@
+//! Tests for {{ exercise }}
+//!
+//! Generated by [utility][utility]
+//!
+//! [utility]: https://github.com/exercism/rust/tree/main/util/exercise
+
+{% if use_maplit %}use maplit::hashmap;
+{% endif %}use {{ exercise_mod }}::*;
@@ -1,8 +1,4 @@
-use crate::{
-    self as exercise,
-    errors::Result,
-    structs::{LabeledTest, LabeledTestItem},
-};
+use crate::{self as exercise, errors::Result, structs::LabeledTest};
 use failure::format_err;
 use std::{collections::HashSet, fs, path::Path};
 
@@ -68,41 +64,32 @@ fn generate_diffs(
     Ok(())
 }
 
-fn get_diffs(
-    case: &LabeledTestItem,
-    diffs: &mut HashSet<String>,
-    tests_content: &str,
-    use_maplit: bool,
-) -> Result<()> {
-    match case {
-        LabeledTestItem::Single(case) => generate_diffs(case, &tests_content, diffs, use_maplit)?,
-        LabeledTestItem::Array(group) => {
-            for case in &group.cases {
-                get_diffs(case, diffs, tests_content, use_maplit)?;
-            }
-        }
-    }
-
-    Ok(())
-}
-
 fn apply_diffs(exercise_name: &str, diffs: &HashSet<String>, tests_content: &str) -> Result<()> {
-    let updated_tests_content = format!(
-        "{}\n{}",
-        tests_content,
-        diffs
-            .iter()
-            .map(|diff| format!("\n{}", diff))
-            .collect::<String>()
+    // Append every diff into one pre-sized buffer; going through format!
+    // would allocate a string per diff and copy the lot again at the end.
+    let mut updated_tests_content = String::with_capacity(
+        tests_content.len() + diffs.iter().map(|diff| diff.len() + 1).sum::<usize>() + 1,
     );
 
+    updated_tests_content.push_str(tests_content);
+    updated_tests_content.push('\n');
+
+    for diff in diffs {
+        updated_tests_content.push('\n');
+        updated_tests_content.push_str(diff);
+    }
+
     let tests_path = Path::new(&*exercise::TRACK_ROOT)
         .join("exercises")
         .join(exercise_name)
         .join("tests")
         .join(format!("{}.rs", exercise_name));
 
-    fs::write(&tests_path, updated_tests_content.as_bytes())?;
+    // Write to a sibling temp file and rename it into place so an
+    // interrupted run can never leave a truncated test suite behind.
+    let tmp_path = tests_path.with_extension("rs.tmp");
+    fs::write(&tmp_path, updated_tests_content.as_bytes())?;
+    fs::rename(&tmp_path, &tests_path)?;
 
     exercise::rustfmt(&tests_path)?;
 
@@ -122,8 +109,8 @@ pub fn update_exercise(exercise_name: &str, use_maplit: bool) -> Result<()> {
 
     let mut diffs: HashSet<String> = HashSet::new();
 
-    for case in &canonical_data.cases {
-        get_diffs(case, &mut diffs, &tests_content, use_maplit)?;
+    for case in canonical_data.iter_cases() {
+        generate_diffs(case, &tests_content, &mut diffs, use_maplit)?;
     }
 
     apply_diffs(exercise_name, &diffs, &tests_content)?;
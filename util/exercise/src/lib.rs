@@ -10,8 +10,9 @@ use serde_json::Value;
 use std::{
     collections::HashMap,
     env, fs, io,
-    path::Path,
+    path::{Path, PathBuf},
     process::{Command, Stdio},
+    sync::Mutex,
 };
 use structs::{CanonicalData, LabeledTest};
 use tera::{Context, Tera};
@@ -35,6 +36,13 @@ lazy_static! {
     };
 }
 
+// Every call to reqwest::get constructs a fresh client, which means a new
+// connection (and TLS handshake) per request. All our requests go to the same
+// couple of hosts, so share one client and let its pool reuse connections.
+lazy_static! {
+    pub static ref HTTP_CLIENT: reqwest::Client = reqwest::Client::new();
+}
+
 // Create a static `Tera` struct so we can access the templates from anywhere.
 lazy_static! {
     pub static ref TEMPLATES: Tera = {
@@ -58,21 +66,45 @@ lazy_static! {
         };
 
         // Build wrappers around the formatting functions.
-        let format_description = |args: &HashMap<String, Value>|
-            args.get("description")
-                .and_then(Value::as_str)
-                .map(format_exercise_description)
-                .map(Value::from)
-                .ok_or(tera::Error::from("Problem formatting the description."))
-        ;
-
-        let format_property = |args: &HashMap<String, Value>|
-            args.get("property")
-                .and_then(Value::as_str)
-                .map(format_exercise_property)
-                .map(Value::from)
-                .ok_or(tera::Error::from("Problem formatting the property."))
-        ;
+        //
+        // The templates call these once per rendered case, and the same
+        // property (and often description) comes up over and over within a
+        // test suite, so each wrapper memoizes its results.
+        let format_description = {
+            let cache: Mutex<HashMap<String, Value>> = Mutex::new(HashMap::new());
+
+            move |args: &HashMap<String, Value>| {
+                let description = args
+                    .get("description")
+                    .and_then(Value::as_str)
+                    .ok_or_else(|| tera::Error::from("Problem formatting the description."))?;
+
+                Ok(cache
+                    .lock()
+                    .unwrap()
+                    .entry(description.to_string())
+                    .or_insert_with(|| Value::from(format_exercise_description(description)))
+                    .clone())
+            }
+        };
+
+        let format_property = {
+            let cache: Mutex<HashMap<String, Value>> = Mutex::new(HashMap::new());
+
+            move |args: &HashMap<String, Value>| {
+                let property = args
+                    .get("property")
+                    .and_then(Value::as_str)
+                    .ok_or_else(|| tera::Error::from("Problem formatting the property."))?;
+
+                Ok(cache
+                    .lock()
+                    .unwrap()
+                    .entry(property.to_string())
+                    .or_insert_with(|| Value::from(format_exercise_property(property)))
+                    .clone())
+            }
+        };
 
         tera.register_function("format_description", format_description);
         tera.register_function("format_property", format_property);
@@ -123,10 +155,15 @@ macro_rules! get_mut {
     };
 }
 
-pub fn run_configlet_command(command: &str, args: &[&str]) -> Result<()> {
-    let track_root = &*TRACK_ROOT;
+// Resolved path of the configlet binary, cached across invocations so a run
+// that issues several configlet commands only probes the bin directory (and
+// potentially downloads the binary) once.
+lazy_static! {
+    static ref CONFIGLET_PATH: Mutex<Option<PathBuf>> = Mutex::new(None);
+}
 
-    let bin_path = Path::new(track_root).join("bin");
+fn locate_configlet() -> Result<PathBuf> {
+    let bin_path = Path::new(&*TRACK_ROOT).join("bin");
 
     let configlet_name_unix = "configlet";
 
@@ -153,8 +190,25 @@ pub fn run_configlet_command(command: &str, args: &[&str]) -> Result<()> {
         }
     };
 
-    Command::new(&bin_path.join(configlet_name))
-        .current_dir(track_root)
+    Ok(bin_path.join(configlet_name))
+}
+
+pub fn run_configlet_command(command: &str, args: &[&str]) -> Result<()> {
+    let configlet_path = {
+        let mut cached_path = CONFIGLET_PATH.lock().unwrap();
+
+        match &*cached_path {
+            Some(path) => path.clone(),
+            None => {
+                let path = locate_configlet()?;
+                *cached_path = Some(path.clone());
+                path
+            }
+        }
+    };
+
+    Command::new(&configlet_path)
+        .current_dir(&*TRACK_ROOT)
         .stdout(Stdio::inherit())
         .arg(command)
         .args(args)
@@ -171,13 +225,108 @@ fn url_for(exercise: &str, file: &str) -> String {
 }
 
 fn get_canonical(exercise: &str, file: &str) -> Result<reqwest::Response> {
-    reqwest::get(&url_for(exercise, file)).map_err(|e| e.into())
+    HTTP_CLIENT
+        .get(&url_for(exercise, file))
+        .send()
+        .map_err(|e| e.into())
+}
+
+// Directory used to cache downloaded canonical data between runs.
+//
+// Returns None when no suitable cache location exists; callers must then
+// fall back to plain network fetches.
+fn cache_dir() -> Option<PathBuf> {
+    env::var_os("XDG_CACHE_HOME")
+        .map(PathBuf::from)
+        .or_else(|| env::var_os("HOME").map(|home| PathBuf::from(home).join(".cache")))
+        .map(|cache| cache.join("exercism-rust-exercise"))
+}
+
+// Paths of the cached canonical data and its ETag sidecar for an exercise
+fn cache_paths(exercise: &str) -> Option<(PathBuf, PathBuf)> {
+    let dir = cache_dir()?;
+    fs::create_dir_all(&dir).ok()?;
+    Some((
+        dir.join(format!("{}.json", exercise)),
+        dir.join(format!("{}.etag", exercise)),
+    ))
 }
 
 // Try to get the canonical data for the exercise of the given name
+//
+// Canonical data rarely changes between invocations, so the downloaded body
+// is cached on disk alongside its ETag. Subsequent runs make a conditional
+// GET and reuse the cached copy when the server answers 304 Not Modified,
+// skipping the body transfer entirely. Any trouble with the cache itself
+// degrades to a plain unconditional fetch.
 pub fn get_canonical_data(exercise_name: &str) -> Result<CanonicalData> {
-    let mut response = get_canonical(exercise_name, "canonical-data.json")?.error_for_status()?;
-    response.json().map_err(|e| e.into())
+    let paths = cache_paths(exercise_name);
+
+    let url = url_for(exercise_name, "canonical-data.json");
+
+    let mut request = HTTP_CLIENT.get(&url);
+
+    if let Some((body_path, etag_path)) = &paths {
+        if body_path.exists() {
+            if let Ok(etag) = fs::read_to_string(etag_path) {
+                request = request.header(reqwest::header::IF_NONE_MATCH, etag.trim());
+            }
+        }
+    }
+
+    let response = request.send()?;
+
+    if response.status() == reqwest::StatusCode::NOT_MODIFIED {
+        if let Some((body_path, _)) = &paths {
+            if let Ok(cached_body) = fs::read(body_path) {
+                if let Ok(canonical_data) = serde_json::from_slice(&cached_body) {
+                    return Ok(canonical_data);
+                }
+            }
+        }
+
+        // The server says our copy is current, but it can't be read or
+        // parsed; fetch the body unconditionally instead of failing.
+        return download_canonical_data(HTTP_CLIENT.get(&url).send()?, &paths);
+    }
+
+    download_canonical_data(response, &paths)
+}
+
+// Read the canonical data out of a fresh (non-304) response, populating the
+// on-disk cache along the way
+fn download_canonical_data(
+    response: reqwest::Response,
+    paths: &Option<(PathBuf, PathBuf)>,
+) -> Result<CanonicalData> {
+    let mut response = response.error_for_status()?;
+
+    let mut body = Vec::new();
+    response.copy_to(&mut body)?;
+
+    if let Some((body_path, etag_path)) = paths {
+        if let Some(etag) = response
+            .headers()
+            .get(reqwest::header::ETAG)
+            .and_then(|value| value.to_str().ok())
+        {
+            // Write the body via a temp file and record the ETag only once
+            // the body is safely in place: an ETag next to a partial body
+            // would pin every later run to a 304 it cannot serve. A failure
+            // to populate the cache only costs us a re-download.
+            let tmp_path = body_path.with_extension("json.tmp");
+
+            let body_cached = fs::write(&tmp_path, &body)
+                .and_then(|_| fs::rename(&tmp_path, body_path))
+                .is_ok();
+
+            if body_cached {
+                let _ = fs::write(etag_path, etag);
+            }
+        }
+    }
+
+    serde_json::from_slice(&body).map_err(|e| e.into())
 }
 
 pub fn canonical_file_exists(exercise: &str, file: &str) -> Result<bool> {
@@ -195,16 +344,33 @@ pub fn get_tests_content(exercise_name: &str) -> io::Result<String> {
 }
 
 pub fn format_exercise_description(description: &str) -> String {
-    description
-        .chars()
-        .filter(|c| c.is_alphanumeric() || *c == ' ')
-        .collect::<String>()
-        .replace(" ", "_")
-        .to_lowercase()
+    // A single pass over the characters; filtering, replacing and
+    // lowercasing separately would allocate an intermediate string each.
+    let mut formatted = String::with_capacity(description.len());
+
+    for c in description.chars() {
+        if c == ' ' {
+            formatted.push('_');
+        } else if c.is_alphanumeric() {
+            formatted.extend(c.to_lowercase());
+        }
+    }
+
+    formatted
 }
 
 pub fn format_exercise_property(property: &str) -> String {
-    property.replace(" ", "_").to_lowercase()
+    let mut formatted = String::with_capacity(property.len());
+
+    for c in property.chars() {
+        if c == ' ' {
+            formatted.push('_');
+        } else {
+            formatted.extend(c.to_lowercase());
+        }
+    }
+
+    formatted
 }
 
 pub fn generate_property_body(property: &str) -> Result<String> {
@@ -223,17 +389,20 @@ pub fn generate_test_function(case: &LabeledTest, use_maplit: bool) -> Result<St
         .map_err(|e| e.into())
 }
 
-pub fn rustfmt(file_path: &Path) -> Result<()> {
-    let rustfmt_is_available = {
-        if let Some(path_var) = env::var_os("PATH") {
-            env::split_paths(&path_var).any(|path| path.join("rustfmt").exists())
-        } else {
-            false
-        }
-    };
+// Absolute path of the rustfmt binary, if one is on the PATH. Resolved once
+// so each invocation neither rescans the PATH nor depends on the spawn-time
+// lookup finding the same binary.
+lazy_static! {
+    static ref RUSTFMT_PATH: Option<PathBuf> = env::var_os("PATH").and_then(|path_var| {
+        env::split_paths(&path_var)
+            .map(|path| path.join("rustfmt"))
+            .find(|path| path.exists())
+    });
+}
 
-    if rustfmt_is_available {
-        Command::new("rustfmt").arg(file_path).output()?;
+pub fn rustfmt(file_path: &Path) -> Result<()> {
+    if let Some(rustfmt_path) = &*RUSTFMT_PATH {
+        Command::new(rustfmt_path).arg(file_path).output()?;
     }
 
     Ok(())
@@ -270,6 +439,14 @@ pub fn update_cargo_toml_version(
                     as_type: "table".to_string(),
                 })?;
 
+        // Rewriting an unchanged Cargo.toml would only churn its mtime and
+        // trigger a needless rebuild of the exercise.
+        if package_table.get("version").and_then(TomlValue::as_str)
+            == Some(canonical_data.version.as_str())
+        {
+            return Ok(());
+        }
+
         package_table.insert(
             "version".to_string(),
             TomlValue::String(canonical_data.version.to_string()),
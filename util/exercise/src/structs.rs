@@ -53,10 +53,13 @@ type Input = Value;
 type Expected = Value;
 
 impl CanonicalData {
+    /// Iterate over every test case, descending into nested case groups.
+    pub fn iter_cases(&self) -> impl Iterator<Item = &LabeledTest> {
+        self.cases.iter().flat_map(LabeledTestItem::iter)
+    }
+
     pub fn properties(&self) -> HashSet<&str> {
-        self.cases
-            .iter()
-            .flat_map(LabeledTestItem::iter)
+        self.iter_cases()
             .map(|case| case.property.as_str())
             .collect()
     }